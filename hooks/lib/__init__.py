@@ -4,6 +4,7 @@
 from .session_manager import (
     generate_session_id,
     get_session_paths,
+    get_cache_dir,
     init_session_file,
     append_event,
     get_active_session,
@@ -18,6 +19,7 @@ from .session_manager import (
 __all__ = [
     "generate_session_id",
     "get_session_paths",
+    "get_cache_dir",
     "init_session_file",
     "append_event",
     "get_active_session",
@@ -45,6 +45,7 @@ KNOWN_KEYS = {
     "llm_threshold",
     "llm_timeout",
     "max_content_length",
+    "min_content_length",
     "min_severity",
     "rule_files",
     "debug",
@@ -13,6 +13,7 @@ Usage:
 """
 
 import datetime
+import hashlib
 import importlib.util
 import json
 import logging
@@ -24,6 +25,8 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 
+from session_manager import get_cache_dir
+
 # =============================================================================
 # CONSTANTS
 # =============================================================================
@@ -100,6 +103,7 @@ class HandlerRegistry:
             with cls._lock:
                 if cls._instance is None:
                     cls._instance = super().__new__(cls)
+                    # name -> (module, create_handler), or a file path placeholder
                     cls._instance._plugins: Dict[str, Any] = {}
                     cls._instance._discovered = False
         return cls._instance
@@ -115,40 +119,121 @@ class HandlerRegistry:
             return loggers_dir
         return None
 
+    def _get_manifest_path(self, loggers_dir: Path) -> Path:
+        """Get the path of the cached plugin manifest for a loggers directory.
+
+        Raises RuntimeError if the home directory cannot be resolved.
+        """
+        digest = hashlib.blake2b(str(loggers_dir.resolve()).encode("utf-8"), digest_size=8).hexdigest()
+        return get_cache_dir() / f"handlers-{digest}.json"
+
+    def _load_module(self, py_file: str) -> Optional[Any]:
+        """Load a handler plugin module from its file path."""
+        module_name = os.path.splitext(os.path.basename(py_file))[0]
+        spec = importlib.util.spec_from_file_location(
+            f"nova_loggers.{module_name}",
+            py_file
+        )
+        if spec and spec.loader:
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return module
+        return None
+
+    def _write_manifest(
+        self,
+        manifest_path: Path,
+        dir_mtime: int,
+        files: Dict[str, List[int]],
+        handlers: Dict[str, str],
+    ) -> None:
+        """Atomically write the plugin manifest (fail-open)."""
+        try:
+            manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(
+                json.dumps({"dir_mtime": dir_mtime, "files": files, "handlers": handlers}),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, manifest_path)
+        except Exception:
+            pass
+
+    def _files_unchanged(self, files: Dict[str, List[int]]) -> bool:
+        """Check that every plugin file still has its recorded mtime and size."""
+        for path, (mtime_ns, size) in files.items():
+            st = os.stat(path)
+            if st.st_mtime_ns != mtime_ns or st.st_size != size:
+                return False
+        return True
+
     def discover_plugins(self) -> None:
-        """Discover and load all handler plugins from the loggers directory."""
+        """
+        Discover all handler plugins from the loggers directory.
+
+        A manifest of {handler_name: file_path} is cached and reused while the
+        loggers directory mtime and every plugin file's mtime and size are
+        unchanged (including files that failed to load). Handlers found through the
+        manifest are registered as path placeholders and only loaded by
+        get_handler() when requested. Discovery and placeholder loading both run
+        under the registry lock so concurrent callers never load the same plugin
+        twice.
+        """
         if self._discovered:
             return
 
+        with self._lock:
+            if not self._discovered:
+                self._scan_plugins()
+
+    def _scan_plugins(self) -> None:
+        """Populate the plugin table (caller must hold the registry lock)."""
         loggers_dir = self._get_loggers_dir()
         if not loggers_dir:
             self._discovered = True
             return
 
-        # Find all Python files (except __init__.py)
-        for py_file in loggers_dir.glob("*.py"):
-            if py_file.name.startswith("_"):
-                continue
+        dir_mtime = loggers_dir.stat().st_mtime_ns
+        manifest_path = None
+        try:
+            manifest_path = self._get_manifest_path(loggers_dir)
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            if manifest.get("dir_mtime") == dir_mtime and self._files_unchanged(manifest["files"]):
+                self._plugins.update(manifest["handlers"])
+                self._discovered = True
+                return
+        except Exception:
+            # Missing or unreadable manifest, or no cache dir: fall back to a full scan
+            pass
+
+        # Find all Python files (except __init__.py); scandir avoids a Path per entry
+        files: Dict[str, List[int]] = {}
+        handlers: Dict[str, str] = {}
+        with os.scandir(loggers_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("_") or not name.endswith(".py"):
+                    continue
 
-            try:
-                # Load the module
-                spec = importlib.util.spec_from_file_location(
-                    f"nova_loggers.{py_file.stem}",
-                    py_file
-                )
-                if spec and spec.loader:
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
+                try:
+                    # Stat before loading so an edit during the load forces a rescan
+                    st = entry.stat()
+                    files[entry.path] = [st.st_mtime_ns, st.st_size]
+
+                    module = self._load_module(entry.path)
 
                     # Check for required exports
                     if hasattr(module, "HANDLER_NAME") and hasattr(module, "create_handler"):
                         handler_name = getattr(module, "HANDLER_NAME")
-                        self._plugins[handler_name] = module
+                        self._plugins[handler_name] = (module, module.create_handler)
+                        handlers[handler_name] = entry.path
 
-            except Exception:
-                # Fail-open: skip plugins that fail to load
-                pass
+                except Exception:
+                    # Fail-open: skip plugins that fail to load
+                    pass
 
+        if manifest_path is not None:
+            self._write_manifest(manifest_path, dir_mtime, files, handlers)
         self._discovered = True
 
     def get_handler(
@@ -175,7 +260,15 @@ class HandlerRegistry:
             return None
 
         try:
-            create_fn = getattr(plugin, "create_handler")
+            if isinstance(plugin, str):
+                # Placeholder from the cached manifest: load on first use
+                with self._lock:
+                    plugin = self._plugins[name]
+                    if isinstance(plugin, str):
+                        module = self._load_module(plugin)
+                        plugin = (module, getattr(module, "create_handler"))
+                        self._plugins[name] = plugin
+            _, create_fn = plugin
             return create_fn(config, session_id)
         except Exception:
             # Fail-open: return None if handler creation fails
@@ -239,11 +332,27 @@ def _load_logging_config() -> Dict[str, Any]:
 # LOGGER FACTORY
 # =============================================================================
 
+# Process-wide handler registry (see get_registry)
+_registry: Optional[HandlerRegistry] = None
+
 # Cache for configured loggers (keyed by session_id)
 _loggers: Dict[str, logging.Logger] = {}
 _setup_lock = threading.Lock()
 
 
+def get_registry() -> HandlerRegistry:
+    """
+    Get the process-wide handler registry.
+
+    Returns the cached instance directly instead of going through the
+    HandlerRegistry singleton constructor on every lookup.
+    """
+    global _registry
+    if _registry is None:
+        _registry = HandlerRegistry()
+    return _registry
+
+
 def get_logger(session_id: str) -> logging.Logger:
     """
     Get or create a logger for the specified session.
@@ -288,7 +397,7 @@ def get_logger(session_id: str) -> logging.Logger:
             return logger
 
         # Add handlers from configuration
-        registry = HandlerRegistry()
+        registry = get_registry()
         handlers_config = config.get("handlers", [])
 
         for handler_name in handlers_config:
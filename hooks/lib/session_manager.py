@@ -12,14 +12,22 @@ This module provides the foundation for session capture, managing:
 All functions follow fail-open philosophy: never crash, always log errors.
 """
 
+from __future__ import annotations
+
 import json
 import logging
+import os
 import platform
 import secrets
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+
+# typing is only referenced by annotations, which the __future__ import keeps
+# as strings, so it is not imported at runtime (saves several ms per hook run).
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Dict, List, Optional, Tuple, Union
 
 # Configure logging to stderr (never stdout - that's for Claude Code communication)
 logging.basicConfig(
@@ -36,6 +44,12 @@ REPORTS_DIR_NAME = "reports"
 SESSION_FILE_EXT = ".jsonl"
 ACTIVE_SESSION_MARKER = ".active"
 
+# Compact JSON encoder for event lines, built once instead of per json.dumps call
+_encode_event = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+# Open flags for appending events (no O_CREAT: the session file must exist)
+APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+
 
 def generate_session_id() -> str:
     """
@@ -82,6 +96,20 @@ def get_session_paths(project_dir: Union[str, Path]) -> Dict[str, Path]:
     return paths
 
 
+def get_cache_dir() -> Path:
+    """
+    Get the per-user cache directory shared by all hooks.
+
+    Resolved on each call rather than at import time: Path.home() raises
+    RuntimeError when HOME is unset and the user has no passwd entry, and
+    callers treat that as "no cache" instead of failing the hook.
+
+    Returns:
+        Path to ~/.cache/nova-tracer (not created here)
+    """
+    return Path.home() / ".cache" / "nova-tracer"
+
+
 def init_session_file(session_id: str, project_dir: Union[str, Path]) -> Optional[Path]:
     """
     Initialize a new session file with an init record.
@@ -127,6 +155,19 @@ def init_session_file(session_id: str, project_dir: Union[str, Path]) -> Optiona
         return None
 
 
+def _encode_event_line(event_data: Dict[str, Any]) -> bytes:
+    """
+    Encode an event as a single compact JSON line (UTF-8 bytes).
+
+    Text that cannot be encoded as UTF-8 (e.g. lone surrogates from tool
+    output) falls back to ASCII-escaped json.dumps.
+    """
+    try:
+        return (_encode_event(event_data) + "\n").encode("utf-8")
+    except (TypeError, ValueError):
+        return (json.dumps(event_data, separators=(",", ":")) + "\n").encode("ascii")
+
+
 def append_event(session_id: str, project_dir: Union[str, Path], event_data: Dict[str, Any]) -> bool:
     """
     Append an event record to the session file.
@@ -146,17 +187,30 @@ def append_event(session_id: str, project_dir: Union[str, Path], event_data: Dic
         paths = get_session_paths(project_dir)
         session_file = paths["sessions"] / f"{session_id}{SESSION_FILE_EXT}"
 
-        if not session_file.exists():
-            logger.warning(f"Session file not found: {session_file}")
-            return False
-
         # Ensure event has type field
         if "type" not in event_data:
             event_data = {"type": "event", **event_data}
 
         # Append as single JSON line (compact format for performance)
-        with open(session_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(event_data, separators=(",", ":")) + "\n")
+        line = _encode_event_line(event_data)
+
+        try:
+            fd = os.open(session_file, APPEND_FLAGS)
+        except FileNotFoundError:
+            logger.warning(f"Session file not found: {session_file}")
+            return False
+
+        # O_APPEND write per event: no buffered file object, no seek. Normally
+        # one syscall; loop so a short write never leaves a partial line.
+        try:
+            remaining = memoryview(line)
+            while remaining:
+                written = os.write(fd, remaining)
+                if not written:
+                    raise OSError("write returned 0 bytes")
+                remaining = remaining[written:]
+        finally:
+            os.close(fd)
 
         return True
 
@@ -450,14 +504,7 @@ def extract_files_accessed(tool_name: str, tool_input: Optional[Dict[str, Any]])
                 paths.append(notebook_path)
 
         # Deduplicate while preserving order
-        seen = set()
-        unique_paths = []
-        for p in paths:
-            if p not in seen:
-                seen.add(p)
-                unique_paths.append(p)
-
-        return unique_paths
+        return list(dict.fromkeys(paths))
 
     except Exception as e:
         logger.warning(f"Failed to extract files accessed: {e}")
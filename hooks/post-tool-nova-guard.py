@@ -27,12 +27,20 @@ Note: In PostToolUse, "block" doesn't prevent execution (tool already ran),
 but sends the reason message to Claude as a warning.
 """
 
+from __future__ import annotations
+
+import functools
+import importlib.util
 import json
 import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+
+# Annotation-only names; typing itself is not imported at runtime
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Dict, List, Optional, Tuple
 
 # Add hooks/lib to path for session_manager imports
 sys.path.insert(0, str(Path(__file__).parent / "lib"))
@@ -43,6 +51,7 @@ try:
         append_event,
         extract_files_accessed,
         get_active_session,
+        get_cache_dir,
         get_next_event_id,
         truncate_output,
     )
@@ -55,13 +64,20 @@ try:
 except ImportError:
     yaml = None
 
-# NOVA Framework imports
-try:
-    from nova.core.parser import NovaRuleFileParser
-    from nova.core.scanner import NovaScanner
-    NOVA_AVAILABLE = True
-except ImportError:
-    NOVA_AVAILABLE = False
+# NOVA Framework imports are deferred to _import_nova(): importing nova
+# dominates hook startup, and most tool calls never reach a scan.
+NovaRuleFileParser: Any = None
+NovaScanner: Any = None
+NOVA_AVAILABLE = importlib.util.find_spec("nova") is not None
+
+# On-disk cache of parsed rules (each hook run is a fresh process)
+RULES_CACHE_MAGIC = b"NVT\x02"  # 3-byte magic + 1-byte format version
+
+# Texts shorter than this are not scanned (config: min_content_length)
+DEFAULT_MIN_CONTENT_LENGTH = 10
+
+# Severity ranks used for filtering (built once, not per call)
+SEVERITY_ORDER = {"low": 0, "medium": 1, "high": 2}
 
 
 def load_config() -> Dict[str, Any]:
@@ -116,6 +132,18 @@ def _load_yaml(path: Path) -> Dict[str, Any]:
         return {}
 
 
+def get_min_content_length(config: Dict[str, Any]) -> int:
+    """Get the minimum scannable content length from config.
+
+    Values that are not integers (e.g. a quoted YAML string like "abc") fall
+    back to the default instead of crashing the hook.
+    """
+    try:
+        return int(config.get("min_content_length", DEFAULT_MIN_CONTENT_LENGTH))
+    except (TypeError, ValueError):
+        return DEFAULT_MIN_CONTENT_LENGTH
+
+
 def get_rules_directory() -> Optional[Path]:
     """Find the rules directory.
 
@@ -124,6 +152,12 @@ def get_rules_directory() -> Optional[Path]:
     2. Parent rules directory (development location)
     3. Project hooks directory
     """
+    return _resolve_rules_dir(os.environ.get("CLAUDE_PROJECT_DIR"))
+
+
+@functools.lru_cache(maxsize=4)
+def _resolve_rules_dir(project_dir: Optional[str]) -> Optional[Path]:
+    """Resolve the rules directory, memoized per project directory."""
     script_dir = Path(__file__).parent
 
     rules_paths = [
@@ -131,7 +165,6 @@ def get_rules_directory() -> Optional[Path]:
         script_dir.parent / "rules",
     ]
 
-    project_dir = os.environ.get("CLAUDE_PROJECT_DIR")
     if project_dir:
         rules_paths.append(
             Path(project_dir) / ".claude" / "hooks" / "nova-guard" / "rules"
@@ -219,6 +252,181 @@ def extract_text_content(tool_name: str, tool_result: Any) -> str:
     return str(tool_result)
 
 
+def _import_nova() -> None:
+    """Import the NOVA Framework classes on first use.
+
+    Raises ImportError (and clears NOVA_AVAILABLE) if nova is installed
+    but cannot be imported.
+    """
+    global NOVA_AVAILABLE, NovaRuleFileParser, NovaScanner
+    if NovaScanner is not None:
+        return
+
+    try:
+        from nova.core.parser import NovaRuleFileParser
+        from nova.core.scanner import NovaScanner
+    except ImportError:
+        NOVA_AVAILABLE = False
+        raise
+
+
+def _rules_fingerprint(rules_dir: Path, rule_files: Tuple[Path, ...]) -> str:
+    """Hash rule file names, mtimes and sizes into a cache key.
+
+    The key is "<rules dir hash>-<contents hash>", so cache files for the
+    same rules directory share a prefix and stale ones can be pruned.
+    The NOVA module's own mtime is mixed in so that upgrading nova-hunting
+    invalidates rules pickled by the previous version.
+    """
+    import hashlib
+
+    resolved_dir = str(rules_dir.resolve())
+    dir_key = hashlib.blake2b(resolved_dir.encode("utf-8"), digest_size=8).hexdigest()
+    entries = [resolved_dir]
+    nova_module = sys.modules.get(NovaScanner.__module__)
+    nova_file = getattr(nova_module, "__file__", None)
+    if nova_file:
+        entries.append(f"nova:{os.stat(nova_file).st_mtime_ns}")
+    for path, st in sorted((p.name, p.stat()) for p in rule_files):
+        entries.append(f"{path}:{st.st_mtime_ns}:{st.st_size}")
+    digest = hashlib.blake2b("\n".join(entries).encode("utf-8"), digest_size=16).hexdigest()
+    return f"{dir_key}-{digest}"
+
+
+def _read_rules_cache(cache_file: Path) -> Optional[List[Tuple[str, Any]]]:
+    """Read a cached ruleset, or return None if the file has the wrong magic.
+
+    Raises FileNotFoundError if there is no cache file yet.
+    """
+    import pickle
+    import zlib
+
+    data = cache_file.read_bytes()
+    if data[:len(RULES_CACHE_MAGIC)] != RULES_CACHE_MAGIC:
+        return None
+    return pickle.loads(zlib.decompress(data[len(RULES_CACHE_MAGIC):]))
+
+
+def _write_rules_cache(cache_file: Path, ruleset: List[Tuple[str, Any]]) -> None:
+    """Atomically write a pickled ruleset to the rules cache.
+
+    Older cache files for the same rules directory are removed afterwards,
+    so edits to the rules do not leave one stale file behind per revision.
+    """
+    import pickle
+    import zlib
+
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, "wb") as f:
+            f.write(RULES_CACHE_MAGIC + zlib.compress(pickle.dumps(ruleset), 1))
+        os.replace(tmp_file, cache_file)
+    finally:
+        tmp_file.unlink(missing_ok=True)
+
+    dir_key = cache_file.name[len("rules-"):].split("-", 1)[0]
+    for stale in cache_file.parent.glob(f"rules-{dir_key}-*.pkl.zlib"):
+        if stale != cache_file:
+            stale.unlink(missing_ok=True)
+
+
+def _parse_rule_files(rule_files: Tuple[Path, ...], debug: bool) -> List[Any]:
+    """Parse rule files, overlapping reads across a small thread pool.
+
+    Returns parsed rules in rule_files order (None for files that failed).
+    NovaRuleFileParser is not assumed thread-safe: each worker gets its own.
+    Only reached on a rules cache miss, so the pool machinery is imported here.
+    """
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    local = threading.local()
+
+    def parse(rule_file: Path) -> Any:
+        parser = getattr(local, "parser", None)
+        if parser is None:
+            parser = local.parser = NovaRuleFileParser()
+        try:
+            return parser.parse_file(str(rule_file))
+        except Exception as e:
+            if debug:
+                print(f"Warning: Failed to load {rule_file}: {e}", file=sys.stderr)
+            return None
+
+    if len(rule_files) < 2:
+        return [parse(rule_file) for rule_file in rule_files]
+
+    with ThreadPoolExecutor(max_workers=min(8, len(rule_files))) as executor:
+        return list(executor.map(parse, rule_files))
+
+
+def load_scanner(rules_dir: Path, config: Dict[str, Any]) -> Any:
+    """Build a NovaScanner loaded with every .nov rule file in rules_dir.
+
+    Parsed rules (not the scanner itself, which may hold model or client
+    state) are cached under get_cache_dir(), keyed by a fingerprint of the
+    rule files, so only the first hook run after a rule change pays the parse
+    cost. Cache errors are never fatal: the rules are parsed instead.
+    Within a process the scanner is also memoized per fingerprint, so scanning
+    both tool input and output loads the rules once.
+    """
+    _import_nova()
+    debug = bool(config.get("debug", False))
+    rule_files = tuple(sorted(rules_dir.glob("*.nov")))
+
+    try:
+        fingerprint = _rules_fingerprint(rules_dir, rule_files)
+    except Exception as e:
+        if debug:
+            print(f"Warning: Ignoring NOVA rules cache: {e}", file=sys.stderr)
+        return _build_scanner.__wrapped__(rule_files, None, debug)
+
+    return _build_scanner(rule_files, fingerprint, debug)
+
+
+@functools.lru_cache(maxsize=4)
+def _build_scanner(rule_files: Tuple[Path, ...], fingerprint: Optional[str], debug: bool) -> Any:
+    """Build a scanner from cached rules, or parse rule_files on a cache miss.
+
+    A fingerprint of None, or a cache dir that cannot be resolved, bypasses
+    the on-disk cache entirely.
+    """
+    cache_file = None
+    ruleset = None
+    if fingerprint is not None:
+        try:
+            cache_file = get_cache_dir() / f"rules-{fingerprint}.pkl.zlib"
+            ruleset = _read_rules_cache(cache_file)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            if debug:
+                print(f"Warning: Ignoring NOVA rules cache: {e}", file=sys.stderr)
+
+    if ruleset is None:
+        parsed = zip(rule_files, _parse_rule_files(rule_files, debug))
+        ruleset = [(rule_file.name, rules) for rule_file, rules in parsed if rules is not None]
+
+        if cache_file is not None:
+            try:
+                _write_rules_cache(cache_file, ruleset)
+            except Exception as e:
+                if debug:
+                    print(f"Warning: Failed to write NOVA rules cache: {e}", file=sys.stderr)
+
+    scanner = NovaScanner()
+
+    for rule_file_name, rules in ruleset:
+        try:
+            scanner.add_rules(rules)
+        except Exception as e:
+            if debug:
+                print(f"Warning: Failed to load {rule_file_name}: {e}", file=sys.stderr)
+
+    return scanner
+
+
 def scan_with_nova(text: str, config: Dict[str, Any], rules_dir: Path) -> List[Dict]:
     """Scan text using NOVA Framework rules.
 
@@ -236,39 +444,36 @@ def scan_with_nova(text: str, config: Dict[str, Any], rules_dir: Path) -> List[D
     detections = []
 
     try:
-        # Initialize NOVA scanner and parser
-        scanner = NovaScanner()
-        parser = NovaRuleFileParser()
-
-        # Load rules from all .nov files
-        rule_files = list(rules_dir.glob("*.nov"))
-
-        for rule_file in rule_files:
-            try:
-                rules = parser.parse_file(str(rule_file))
-                scanner.add_rules(rules)
-            except Exception as e:
-                if config.get("debug", False):
-                    print(f"Warning: Failed to load {rule_file}: {e}", file=sys.stderr)
+        scanner = load_scanner(rules_dir, config)
 
         # Run the scan
         results = scanner.scan(text)
 
         # Process results
+        add_detection = detections.append
         for match in results:
-            if match.get("matched", False):
-                meta = match.get("meta", {})
-                detection = {
-                    "rule_name": match.get("rule_name", "unknown"),
-                    "severity": meta.get("severity", "medium"),
-                    "description": meta.get("description", ""),
-                    "category": meta.get("category", "unknown"),
-                    "matched_keywords": list(match.get("matching_keywords", {}).keys()),
-                    "matched_semantics": list(match.get("matching_semantics", {}).keys()),
-                    "llm_match": bool(match.get("matching_llm", {})),
-                    "confidence": 0.0,
-                }
-                detections.append(detection)
+            if not match.get("matched", False):
+                continue
+
+            meta = match.get("meta", {})
+            keywords = match.get("matching_keywords") or {}
+            semantics = match.get("matching_semantics") or {}
+            llm = match.get("matching_llm") or {}
+            # matching_llm only flags which LLM patterns matched; the
+            # evaluator's scores are reported separately in llm_scores
+            scores = match.get("llm_scores") or {}
+            llm_scores = [scores[k] for k in llm if k in scores]
+
+            add_detection({
+                "rule_name": match.get("rule_name", "unknown"),
+                "severity": meta.get("severity", "medium"),
+                "description": meta.get("description", ""),
+                "category": meta.get("category", "unknown"),
+                "matched_keywords": list(keywords),
+                "matched_semantics": list(semantics),
+                "llm_match": bool(llm),
+                "confidence": float(max(llm_scores)) if llm_scores else 0.0,
+            })
 
     except Exception as e:
         if config.get("debug", False):
@@ -407,15 +612,50 @@ def get_source_info(tool_name: str, tool_input: Dict[str, Any]) -> str:
 
 def filter_by_severity(detections: List[Dict], min_severity: str) -> List[Dict]:
     """Filter detections by minimum severity level."""
-    severity_order = {"low": 0, "medium": 1, "high": 2}
-    min_level = severity_order.get(min_severity.lower(), 0)
+    min_level = SEVERITY_ORDER.get(min_severity.lower(), 0)
 
     return [
         d for d in detections
-        if severity_order.get(d.get("severity", "medium").lower(), 1) >= min_level
+        if SEVERITY_ORDER.get(d.get("severity", "medium").lower(), 1) >= min_level
     ]
 
 
+def aggregate_detections(
+    detections: List[Dict],
+) -> Tuple[List[Dict], str, Optional[str], List[str]]:
+    """Deduplicate detections by rule_name and derive the verdict in one pass.
+
+    Args:
+        detections: Detections as returned by scan_with_nova()
+
+    Returns:
+        Tuple of (unique_detections, verdict, severity, rules_matched).
+        With no detections, verdict is "allowed" and severity None; with any
+        high-severity detection, "blocked" and "high"; otherwise "warned" and
+        the highest of "medium"/"low".
+    """
+    # Insertion-ordered: rule_name -> first detection for that rule
+    unique: Dict[str, Dict] = {}
+    max_level = -1
+
+    for d in detections:
+        rule_name = d.get("rule_name", "unknown")
+        if rule_name in unique:
+            continue
+        unique[rule_name] = d
+
+        level = SEVERITY_ORDER.get(d.get("severity", "medium"), 0)
+        if level > max_level:
+            max_level = level
+
+    if max_level < 0:
+        return [], "allowed", None, []
+
+    severity = ("low", "medium", "high")[max_level]
+    verdict = "blocked" if severity == "high" else "warned"
+    return list(unique.values()), verdict, severity, list(unique)
+
+
 def parse_mcp_tool_name(tool_name: str) -> Dict[str, Any]:
     """
     Parse MCP tool name to extract server and function.
@@ -593,9 +833,6 @@ def main() -> None:
     # Load configuration
     config = load_config()
 
-    # Find rules directory
-    rules_dir = get_rules_directory()
-
     # Read hook input from stdin
     try:
         input_data = json.load(sys.stdin)
@@ -647,8 +884,14 @@ def main() -> None:
     # Extract text from tool_input for scanning (AC1: Scan tool inputs)
     input_text = extract_input_text(tool_input)
 
-    # Only scan monitored tools with sufficient content
-    if should_scan and NOVA_AVAILABLE and rules_dir:
+    # Only scan monitored tools with sufficient content. When both texts are
+    # trivially short, the rules lookup and NOVA loading are skipped entirely.
+    min_length = get_min_content_length(config)
+    do_scan_input = should_scan and bool(input_text) and len(input_text) >= min_length
+    do_scan_output = should_scan and bool(text) and len(text) >= min_length
+    rules_dir = get_rules_directory() if NOVA_AVAILABLE and (do_scan_input or do_scan_output) else None
+
+    if rules_dir:
         max_length = config.get("max_content_length", 50000)
         min_severity = config.get("min_severity", "low")
 
@@ -656,13 +899,13 @@ def main() -> None:
             scan_start = datetime.now(timezone.utc)
 
             # Scan tool_input if it has content (AC1)
-            if input_text and len(input_text) >= 10:
+            if do_scan_input:
                 scan_input = input_text[:max_length] if len(input_text) > max_length else input_text
                 input_detections = scan_with_nova(scan_input, config, rules_dir)
                 detections.extend(input_detections)
 
             # Scan tool_output if it has content (AC2)
-            if text and len(text) >= 10:
+            if do_scan_output:
                 scan_output = text[:max_length] if len(text) > max_length else text
                 output_detections = scan_with_nova(scan_output, config, rules_dir)
                 detections.extend(output_detections)
@@ -670,34 +913,10 @@ def main() -> None:
             scan_end = datetime.now(timezone.utc)
             nova_scan_time_ms = int((scan_end - scan_start).total_seconds() * 1000)
 
-            # Filter by minimum severity
-            detections = filter_by_severity(detections, min_severity)
-
-            # Deduplicate detections by rule_name
-            seen_rules = set()
-            unique_detections = []
-            for d in detections:
-                rule_name = d.get("rule_name", "unknown")
-                if rule_name not in seen_rules:
-                    seen_rules.add(rule_name)
-                    unique_detections.append(d)
-            detections = unique_detections
-
-            # Determine verdict from detections
-            if detections:
-                # Get highest severity
-                severities = [d.get("severity", "medium") for d in detections]
-                if "high" in severities:
-                    nova_verdict = "blocked"
-                    nova_severity = "high"
-                elif "medium" in severities:
-                    nova_verdict = "warned"
-                    nova_severity = "medium"
-                else:
-                    nova_verdict = "warned"
-                    nova_severity = "low"
-
-                nova_rules_matched = [d.get("rule_name", "unknown") for d in detections]
+            # Filter by minimum severity, deduplicate and determine verdict
+            detections, nova_verdict, nova_severity, nova_rules_matched = aggregate_detections(
+                filter_by_severity(detections, min_severity)
+            )
 
         except Exception as e:
             # AC4: Fail-open on scan error - set scan_failed verdict
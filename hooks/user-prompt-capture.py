@@ -14,17 +14,12 @@ Exit codes:
   0 = Success (always - fail-open design)
 """
 
+# Keep module-level imports minimal: session_manager is imported inside main()
+# once there is a prompt to capture, so empty submits exit early.
 import json
 import os
 import sys
-from datetime import datetime, timezone
-from pathlib import Path
-
-# Add lib directory to path for imports
-lib_dir = Path(__file__).parent / "lib"
-sys.path.insert(0, str(lib_dir))
-
-from session_manager import append_event, get_active_session, get_next_event_id
+import time
 
 
 def main() -> None:
@@ -50,6 +45,10 @@ def main() -> None:
         if not prompt:
             sys.exit(0)
 
+        # Deferred imports: only needed once there is something to capture
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "lib"))
+        from session_manager import append_event, get_active_session, get_next_event_id
+
         # Use CLAUDE_PROJECT_DIR if available, fallback to cwd
         project_dir = os.environ.get("CLAUDE_PROJECT_DIR", os.getcwd())
 
@@ -63,7 +62,8 @@ def main() -> None:
         event_id = get_next_event_id(session_id, project_dir)
 
         # Build prompt record
-        timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+        timestamp = f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{nanos // 1000:06d}Z"
         prompt_record = {
             "type": "user_prompt",
             "id": event_id,
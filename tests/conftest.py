@@ -0,0 +1,51 @@
+"""
+Shared pytest configuration and fixtures.
+
+Hooks cache parsed rules and plugin manifests under ~/.cache/nova-tracer.
+HOME is pointed at a throwaway directory for the whole run (before any test
+module imports the hooks) so the suite never writes to the real cache.
+"""
+
+import importlib.util
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+_saved_home = None
+_temp_home = None
+
+
+def pytest_configure(config):
+    """Redirect HOME to a temporary directory for this test run."""
+    global _saved_home, _temp_home
+    _saved_home = os.environ.get("HOME")
+    _temp_home = tempfile.mkdtemp(prefix="nova-tracer-home-")
+    os.environ["HOME"] = _temp_home
+
+
+def pytest_unconfigure(config):
+    """Restore HOME and remove the temporary directory."""
+    if _saved_home is None:
+        os.environ.pop("HOME", None)
+    else:
+        os.environ["HOME"] = _saved_home
+    if _temp_home:
+        shutil.rmtree(_temp_home, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def post_tool_hook_path():
+    """Path to the post-tool hook."""
+    return Path(__file__).parent.parent / "hooks" / "post-tool-nova-guard.py"
+
+
+@pytest.fixture(scope="module")
+def nova_guard_module(post_tool_hook_path):
+    """Load the post-tool-nova-guard module once per test module."""
+    spec = importlib.util.spec_from_file_location("post_tool_nova_guard", post_tool_hook_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
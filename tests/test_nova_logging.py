@@ -0,0 +1,180 @@
+"""
+Tests for the logging handler registry in nova_logging.
+
+Covers plugin discovery and the cached plugin manifest:
+- Full scan writes a manifest; later registries reuse it
+- Manifest placeholders are loaded lazily by get_handler()
+- In-place edits to plugin files invalidate the manifest
+- Corrupt manifests fall back to a full scan
+- An unresolvable cache dir disables the manifest
+- get_registry() caches the process-wide registry
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add hooks/lib to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "hooks" / "lib"))
+
+import nova_logging
+from nova_logging import HandlerRegistry
+
+
+PLUGIN_SOURCE = '''
+import logging
+
+HANDLER_NAME = "{name}"
+
+
+def create_handler(config, session_id):
+    return logging.NullHandler()
+'''
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+
+@pytest.fixture
+def loggers_dir(tmp_path, monkeypatch):
+    """Point the registry at a temporary loggers dir and cache dir."""
+    plugins = tmp_path / "loggers"
+    plugins.mkdir()
+    (plugins / "mem_handler.py").write_text(PLUGIN_SOURCE.format(name="mem"))
+
+    monkeypatch.setattr(nova_logging, "get_cache_dir", lambda: tmp_path / "cache")
+    monkeypatch.setattr(HandlerRegistry, "_get_loggers_dir", lambda self: plugins)
+    return plugins
+
+
+def new_registry(monkeypatch):
+    """Create a fresh registry, bypassing the process-wide singleton."""
+    monkeypatch.setattr(HandlerRegistry, "_instance", None)
+    return HandlerRegistry()
+
+
+def rewrite_in_place(path, source):
+    """Rewrite a file without touching its directory's mtime."""
+    dir_stat = path.parent.stat()
+    path.write_text(source)
+    os.utime(path.parent, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+
+
+# ============================================================================
+# Manifest Tests
+# ============================================================================
+
+
+class TestPluginManifest:
+    """Tests for the cached plugin manifest."""
+
+    def test_full_scan_writes_manifest(self, loggers_dir, monkeypatch, tmp_path):
+        """First discovery loads plugins and writes a manifest."""
+        registry = new_registry(monkeypatch)
+
+        assert registry.available_handlers == ["mem"]
+        assert isinstance(registry._plugins["mem"], tuple)
+        assert list((tmp_path / "cache").glob("handlers-*.json"))
+
+    def test_manifest_hit_registers_lazy_placeholders(self, loggers_dir, monkeypatch):
+        """A matching manifest registers paths; get_handler() loads on demand."""
+        new_registry(monkeypatch).discover_plugins()
+
+        registry = new_registry(monkeypatch)
+        assert registry.available_handlers == ["mem"]
+        assert registry._plugins["mem"] == str(loggers_dir / "mem_handler.py")
+
+        handler = registry.get_handler("mem", {}, "session")
+        assert isinstance(handler, logging.NullHandler)
+        assert isinstance(registry._plugins["mem"], tuple)
+
+    def test_in_place_fix_of_broken_plugin_is_detected(self, loggers_dir, monkeypatch):
+        """Fixing a plugin that failed to load is picked up without a dir change."""
+        broken = loggers_dir / "late_handler.py"
+        broken.write_text("def broken(:\n")
+        new_registry(monkeypatch).discover_plugins()
+        new_registry(monkeypatch).discover_plugins()
+
+        rewrite_in_place(broken, PLUGIN_SOURCE.format(name="late"))
+
+        assert sorted(new_registry(monkeypatch).available_handlers) == ["late", "mem"]
+
+    def test_in_place_handler_rename_is_detected(self, loggers_dir, monkeypatch):
+        """Changing HANDLER_NAME in place invalidates the manifest."""
+        new_registry(monkeypatch).discover_plugins()
+
+        rewrite_in_place(loggers_dir / "mem_handler.py", PLUGIN_SOURCE.format(name="memory"))
+
+        assert new_registry(monkeypatch).available_handlers == ["memory"]
+
+    def test_corrupt_manifest_falls_back_to_scan(self, loggers_dir, monkeypatch, tmp_path):
+        """An unreadable manifest is ignored and rewritten."""
+        new_registry(monkeypatch).discover_plugins()
+        for manifest in (tmp_path / "cache").glob("handlers-*.json"):
+            manifest.write_text("{not json")
+
+        registry = new_registry(monkeypatch)
+        assert registry.available_handlers == ["mem"]
+        assert isinstance(registry._plugins["mem"], tuple)
+
+    def test_unresolvable_cache_dir_falls_back_to_scan(self, loggers_dir, monkeypatch, tmp_path):
+        """Without a home directory plugins are still discovered."""
+        def no_home():
+            raise RuntimeError("Could not determine home directory.")
+
+        monkeypatch.setattr(nova_logging, "get_cache_dir", no_home)
+
+        registry = new_registry(monkeypatch)
+        assert registry.available_handlers == ["mem"]
+        assert not (tmp_path / "cache").exists()
+
+    def test_placeholder_is_loaded_once(self, loggers_dir, monkeypatch):
+        """Concurrent get_handler() calls load a placeholder module once."""
+        new_registry(monkeypatch).discover_plugins()
+        registry = new_registry(monkeypatch)
+        load_module = registry._load_module
+        loads = []
+
+        def counting_load(py_file):
+            loads.append(py_file)
+            time.sleep(0.01)  # widen the race window
+            return load_module(py_file)
+
+        monkeypatch.setattr(registry, "_load_module", counting_load)
+        threads = [
+            threading.Thread(target=registry.get_handler, args=("mem", {}, "session"))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert loads == [str(loggers_dir / "mem_handler.py")]
+
+
+# ============================================================================
+# Registry Accessor Tests
+# ============================================================================
+
+
+class TestGetRegistry:
+    """Tests for the get_registry() accessor."""
+
+    def test_returns_cached_singleton(self, loggers_dir, monkeypatch):
+        """get_registry() creates the registry once and then reuses it."""
+        monkeypatch.setattr(HandlerRegistry, "_instance", None)
+        monkeypatch.setattr(nova_logging, "_registry", None)
+
+        registry = nova_logging.get_registry()
+
+        assert registry is nova_logging.get_registry()
+        assert registry is HandlerRegistry()
+        assert registry.available_handlers == ["mem"]
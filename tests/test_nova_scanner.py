@@ -9,7 +9,7 @@ Consolidated tests covering acceptance criteria:
 - AC5: Performance target < 5ms per scan
 """
 
-import importlib.util
+import io
 import json
 import subprocess
 import sys
@@ -28,20 +28,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "hooks" / "lib"))
 # ============================================================================
 
 
-@pytest.fixture(scope="module")
-def nova_guard_module():
-    """Load the post-tool-nova-guard module once for all tests."""
-    hook_path = Path(__file__).parent.parent / "hooks" / "post-tool-nova-guard.py"
-    spec = importlib.util.spec_from_file_location("post_tool_nova_guard", hook_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
-
-
 @pytest.fixture
-def hook_path():
+def hook_path(post_tool_hook_path):
     """Path to the post-tool hook."""
-    return Path(__file__).parent.parent / "hooks" / "post-tool-nova-guard.py"
+    return post_tool_hook_path
 
 
 # ============================================================================
@@ -165,6 +155,213 @@ class TestScanWithNova:
         assert isinstance(result, list)
 
 
+    def test_confidence_uses_llm_score(self, nova_guard_module, monkeypatch):
+        """Confidence is the LLM score when reported, 0.0 otherwise."""
+        results = [
+            {"matched": True, "rule_name": "Kw", "matching_keywords": {"$a": True}},
+            {"matched": True, "rule_name": "Sem", "matching_semantics": {"$s": 0.9}},
+            {
+                "matched": True, "rule_name": "Llm",
+                "matching_llm": {"$l": True, "$m": True},
+                "llm_scores": {"$l": 0.8, "$m": 0.65, "$n": 0.95},
+            },
+            {"matched": True, "rule_name": "LlmNoScore", "matching_llm": {"$l": True}},
+            {"matched": False, "rule_name": "Miss"},
+        ]
+
+        class StubScanner:
+            def scan(self, text):
+                return results
+
+        monkeypatch.setattr(nova_guard_module, "NOVA_AVAILABLE", True)
+        monkeypatch.setattr(nova_guard_module, "load_scanner", lambda rules_dir, config: StubScanner())
+
+        detections = nova_guard_module.scan_with_nova("text", {}, Path("/unused"))
+
+        assert [(d["rule_name"], d["confidence"]) for d in detections] == [
+            ("Kw", 0.0), ("Sem", 0.0), ("Llm", 0.8), ("LlmNoScore", 0.0),
+        ]
+        assert detections[1]["matched_semantics"] == ["$s"]
+        assert [d["llm_match"] for d in detections] == [False, False, True, True]
+
+
+# ============================================================================
+# Minimum Content Length Tests
+# ============================================================================
+
+
+class TestMinContentLength:
+    """Tests for the min_content_length short-circuit in main()."""
+
+    @pytest.mark.parametrize("config,tool_response,expect_lookup", [
+        ({}, "short", False),
+        ({}, "long enough to scan", True),
+        ({"min_content_length": 3}, "short", True),
+        ({"min_content_length": "3"}, "short", True),
+        ({"min_content_length": "abc"}, "short", False),
+        ({"min_content_length": "abc"}, "long enough to scan", True),
+        ({"min_content_length": None}, "long enough to scan", True),
+    ])
+    def test_rules_lookup_only_for_scannable_content(
+        self, nova_guard_module, monkeypatch, config, tool_response, expect_lookup
+    ):
+        """Short content skips get_rules_directory; bad values fall back to 10."""
+        lookups = []
+        hook_input = {"tool_name": "Read", "tool_input": {"file_path": "/x"}, "tool_response": tool_response}
+
+        monkeypatch.setattr(nova_guard_module, "load_config", lambda: config)
+        monkeypatch.setattr(nova_guard_module, "NOVA_AVAILABLE", True)
+        monkeypatch.setattr(nova_guard_module, "get_rules_directory", lambda: lookups.append(1))
+        monkeypatch.setattr(nova_guard_module, "capture_event", lambda **kwargs: {})
+        monkeypatch.setattr(sys, "stdin", io.StringIO(json.dumps(hook_input)))
+
+        with pytest.raises(SystemExit) as exc_info:
+            nova_guard_module.main()
+
+        assert exc_info.value.code == 0
+        assert bool(lookups) == expect_lookup
+
+
+# ============================================================================
+# Rules Cache Tests
+# ============================================================================
+
+
+class FakeScanner:
+    """Picklable stand-in for NovaScanner."""
+
+    def __init__(self):
+        self.rules = []
+
+    def add_rules(self, rules):
+        self.rules.extend(rules)
+
+
+class FakeParser:
+    """Stand-in for NovaRuleFileParser that counts parsed files."""
+
+    calls = 0
+
+    def parse_file(self, path):
+        FakeParser.calls += 1
+        if Path(path).stem == "broken":
+            raise ValueError("bad rule")
+        return [Path(path).stem]
+
+
+class TestRulesCache:
+    """Tests for the on-disk cache of parsed rules."""
+
+    @pytest.fixture
+    def fake_nova(self, nova_guard_module, monkeypatch, tmp_path):
+        """Swap NOVA classes for fakes and point the cache at tmp_path."""
+        monkeypatch.setattr(nova_guard_module, "NovaScanner", FakeScanner, raising=False)
+        monkeypatch.setattr(nova_guard_module, "NovaRuleFileParser", FakeParser, raising=False)
+        monkeypatch.setattr(nova_guard_module, "get_cache_dir", lambda: tmp_path / "cache")
+        nova_guard_module._build_scanner.cache_clear()
+        FakeParser.calls = 0
+        rules_dir = tmp_path / "rules"
+        rules_dir.mkdir()
+        (rules_dir / "a.nov").write_text("rule a")
+        (rules_dir / "b.nov").write_text("rule b")
+        yield rules_dir
+        nova_guard_module._build_scanner.cache_clear()
+
+    def test_second_load_uses_cache(self, nova_guard_module, fake_nova):
+        """Rules are parsed once, then served from the cache."""
+        first = nova_guard_module.load_scanner(fake_nova, {})
+        nova_guard_module._build_scanner.cache_clear()
+        second = nova_guard_module.load_scanner(fake_nova, {})
+
+        assert FakeParser.calls == 2
+        assert sorted(second.rules) == sorted(first.rules) == ["a", "b"]
+
+    def test_scanner_reused_within_process(self, nova_guard_module, fake_nova, tmp_path):
+        """Repeated loads in one process return the memoized scanner."""
+        first = nova_guard_module.load_scanner(fake_nova, {})
+        for cache_file in (tmp_path / "cache").glob("rules-*.pkl.zlib"):
+            cache_file.unlink()
+
+        assert nova_guard_module.load_scanner(fake_nova, {}) is first
+        assert FakeParser.calls == 2
+
+    def test_rule_change_invalidates_cache(self, nova_guard_module, fake_nova):
+        """Modifying a rule file forces a re-parse."""
+        nova_guard_module.load_scanner(fake_nova, {})
+        (fake_nova / "a.nov").write_text("rule a, edited")
+
+        nova_guard_module.load_scanner(fake_nova, {})
+        assert FakeParser.calls == 4
+
+    def test_rule_change_prunes_stale_cache_file(self, nova_guard_module, fake_nova, tmp_path):
+        """Only the newest cache file per rules directory is kept."""
+        nova_guard_module.load_scanner(fake_nova, {})
+        other_rules = tmp_path / "other-rules"
+        other_rules.mkdir()
+        (other_rules / "z.nov").write_text("rule z")
+        nova_guard_module.load_scanner(other_rules, {})
+
+        (fake_nova / "a.nov").write_text("rule a, edited")
+        nova_guard_module.load_scanner(fake_nova, {})
+
+        assert len(list((tmp_path / "cache").glob("rules-*.pkl.zlib"))) == 2
+
+    def test_unresolvable_cache_dir_skips_disk_cache(self, nova_guard_module, fake_nova, monkeypatch):
+        """Without a home directory the rules are parsed, not cached."""
+        def no_home():
+            raise RuntimeError("Could not determine home directory.")
+
+        monkeypatch.setattr(nova_guard_module, "get_cache_dir", no_home)
+
+        scanner = nova_guard_module.load_scanner(fake_nova, {})
+        assert sorted(scanner.rules) == ["a", "b"]
+        assert FakeParser.calls == 2
+
+    def test_real_rules_round_trip(self, nova_guard_module, monkeypatch, tmp_path):
+        """Rules loaded from the cache scan exactly like freshly parsed rules."""
+        pytest.importorskip("nova.core.scanner")
+        monkeypatch.setattr(nova_guard_module, "get_cache_dir", lambda: tmp_path / "cache")
+        rules_dir = Path(__file__).parent.parent / "rules"
+        samples = sorted((Path(__file__).parent.parent / "test-files").glob("*.txt"))
+
+        def matched(scanner):
+            return [
+                sorted(r.get("rule_name") for r in scanner.scan(sample.read_text()) if r.get("matched"))
+                for sample in samples
+            ]
+
+        nova_guard_module._build_scanner.cache_clear()
+        fresh = nova_guard_module.load_scanner(rules_dir, {})
+        assert list((tmp_path / "cache").glob("rules-*.pkl.zlib"))
+
+        nova_guard_module._build_scanner.cache_clear()
+        cached = nova_guard_module.load_scanner(rules_dir, {})
+        nova_guard_module._build_scanner.cache_clear()
+
+        assert cached is not fresh
+        assert matched(cached) == matched(fresh)
+
+    def test_parse_failures_skip_only_that_file(self, nova_guard_module, fake_nova):
+        """A rule file that fails to parse does not drop the others."""
+        (fake_nova / "broken.nov").write_text("not a rule")
+        (fake_nova / "c.nov").write_text("rule c")
+
+        scanner = nova_guard_module.load_scanner(fake_nova, {})
+
+        assert scanner.rules == ["a", "b", "c"]
+
+    def test_corrupt_cache_falls_back_to_parsing(self, nova_guard_module, fake_nova, tmp_path):
+        """A cache file with the wrong magic is ignored."""
+        nova_guard_module.load_scanner(fake_nova, {})
+        nova_guard_module._build_scanner.cache_clear()
+        for cache_file in (tmp_path / "cache").glob("rules-*.pkl.zlib"):
+            cache_file.write_bytes(b"garbage")
+
+        scanner = nova_guard_module.load_scanner(fake_nova, {})
+        assert FakeParser.calls == 4
+        assert sorted(scanner.rules) == ["a", "b"]
+
+
 # ============================================================================
 # Warning Format Tests
 # ============================================================================
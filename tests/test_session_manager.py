@@ -30,6 +30,7 @@ from session_manager import (
     finalize_session,
     read_session_events,
 )
+import session_manager
 
 
 class TestGenerateSessionId:
@@ -235,6 +236,36 @@ class TestAppendEvent:
             result = append_event(session_id, tmpdir, {"bad": NotSerializable()})
             assert result is False
 
+    def test_short_writes_are_completed(self, monkeypatch):
+        """A short os.write still produces one complete JSON line."""
+        real_write = session_manager.os.write
+        monkeypatch.setattr(session_manager.os, "write", lambda fd, data: real_write(fd, data[:7]))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            session_id = generate_session_id()
+            init_session_file(session_id, tmpdir)
+
+            assert append_event(session_id, tmpdir, {"id": 1, "tool_name": "Read"}) is True
+            assert append_event(session_id, tmpdir, {"id": 2, "tool_name": "Bash"}) is True
+
+            session_file = Path(tmpdir) / ".nova-tracer" / "sessions" / f"{session_id}.jsonl"
+            lines = session_file.read_text().strip().split("\n")
+            assert [json.loads(line)["tool_name"] for line in lines[1:]] == ["Read", "Bash"]
+
+    def test_non_ascii_and_surrogates_round_trip(self):
+        """Non-ASCII text and lone surrogates are written as valid JSON lines."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            session_id = generate_session_id()
+            init_session_file(session_id, tmpdir)
+
+            assert append_event(session_id, tmpdir, {"id": 1, "prompt": "héllo ✓"}) is True
+            assert append_event(session_id, tmpdir, {"id": 2, "prompt": "bad \ud800"}) is True
+
+            session_file = Path(tmpdir) / ".nova-tracer" / "sessions" / f"{session_id}.jsonl"
+            lines = session_file.read_text(encoding="utf-8").strip().split("\n")
+            assert json.loads(lines[1])["prompt"] == "héllo ✓"
+            assert json.loads(lines[2])["prompt"] == "bad \ud800"
+
     def test_performance_under_threshold(self):
         """Append operation completes in < 0.5ms average."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -0,0 +1,69 @@
+"""
+Tests for the User Prompt Capture Hook.
+
+Runs hooks/user-prompt-capture.py as a subprocess, the way Claude Code does:
+- Empty prompts exit 0 before session_manager is imported
+- Captured prompts are appended with a microsecond UTC timestamp
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+# Add hooks/lib to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "hooks" / "lib"))
+
+from session_manager import (
+    generate_session_id,
+    init_session_file,
+)
+
+HOOK_PATH = Path(__file__).parent.parent / "hooks" / "user-prompt-capture.py"
+TIMESTAMP_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}Z$")
+
+
+def run_hook(hook_input, project_dir):
+    """Run the hook with -X importtime so stderr lists every imported module."""
+    env = dict(os.environ, CLAUDE_PROJECT_DIR=str(project_dir))
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", str(HOOK_PATH)],
+        input=json.dumps(hook_input),
+        capture_output=True,
+        text=True,
+        cwd=project_dir,
+        env=env,
+    )
+
+
+class TestUserPromptCapture:
+    """End-to-end tests for the UserPromptSubmit hook."""
+
+    def test_empty_prompt_exits_before_importing_session_manager(self):
+        """An empty prompt exits 0 without loading the session library."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = run_hook({"prompt": ""}, tmpdir)
+
+        assert result.returncode == 0
+        assert "session_manager" not in result.stderr
+
+    def test_prompt_is_captured_with_microsecond_timestamp(self):
+        """A prompt is appended as a user_prompt record with a UTC timestamp."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            session_id = generate_session_id()
+            session_file = init_session_file(session_id, tmpdir)
+
+            result = run_hook({"prompt": "hello nova"}, tmpdir)
+
+            lines = session_file.read_text(encoding="utf-8").strip().split("\n")
+
+        assert result.returncode == 0
+        assert "session_manager" in result.stderr
+        record = json.loads(lines[-1])
+        assert record["type"] == "user_prompt"
+        assert record["prompt"] == "hello nova"
+        assert record["prompt_length"] == len("hello nova")
+        assert TIMESTAMP_RE.match(record["timestamp"])
@@ -36,9 +36,9 @@ from session_manager import (
 
 
 @pytest.fixture
-def hook_path():
+def hook_path(post_tool_hook_path):
     """Path to the post-tool hook."""
-    return Path(__file__).parent.parent / "hooks" / "post-tool-nova-guard.py"
+    return post_tool_hook_path
 
 
 @pytest.fixture
@@ -121,6 +121,42 @@ class TestRulesCapture:
         assert nova_rules_matched == ["unknown"]
 
 
+# ============================================================================
+# Aggregation Tests (AC1-AC4)
+# ============================================================================
+
+
+class TestAggregateDetections:
+    """Tests for the hook's single-pass detection aggregation."""
+
+    @pytest.mark.parametrize("detections,expected_verdict,expected_severity", [
+        ([], "allowed", None),
+        ([{"severity": "low", "rule_name": "A"}], "warned", "low"),
+        ([{"rule_name": "A"}], "warned", "medium"),
+        ([{"severity": "low", "rule_name": "A"}, {"severity": "high", "rule_name": "B"}], "blocked", "high"),
+        ([{"severity": "unknown", "rule_name": "A"}], "warned", "low"),
+    ])
+    def test_verdict_and_severity(self, nova_guard_module, detections, expected_verdict, expected_severity):
+        """Highest severity determines the verdict."""
+        _, verdict, severity, _ = nova_guard_module.aggregate_detections(detections)
+        assert verdict == expected_verdict
+        assert severity == expected_severity
+
+    def test_deduplicates_by_rule_name_in_order(self, nova_guard_module):
+        """Duplicate rules keep their first detection and original order."""
+        detections = [
+            {"severity": "low", "rule_name": "B"},
+            {"severity": "high", "rule_name": "A"},
+            {"severity": "high", "rule_name": "B"},
+        ]
+
+        unique, verdict, _, rules = nova_guard_module.aggregate_detections(detections)
+
+        assert rules == ["B", "A"]
+        assert unique == detections[:2]
+        assert verdict == "blocked"
+
+
 # ============================================================================
 # Scan Time Tests (AC5)
 # ============================================================================